@@ -0,0 +1,242 @@
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+DEFAULT_CACHE_DIR = os.path.join("data", "raw", "event_pages")
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_TIMEOUT = 30
+
+EVENT_HEADER_KEYWORDS = ("event", "name", "title", "description")
+DATE_HEADER_KEYWORDS = ("date",)
+
+
+def build_session(max_workers: int = DEFAULT_MAX_WORKERS) -> requests.Session:
+    """
+    Create a requests session whose connection pool matches the worker count.
+
+    Args:
+        max_workers (int): Number of threads that will share the session.
+
+    Returns:
+        requests.Session: Session reusing keep-alive connections per host.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": "brent-oil-event-collector/1.0"})
+    return session
+
+
+def _cache_paths(cache_dir: str, url: str):
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, f"{key}.html"), os.path.join(cache_dir, f"{key}.json")
+
+
+def _read_cache_meta(body_path: str, meta_path: str) -> dict:
+    # A missing body or unreadable metadata is treated as a cache miss
+    if not os.path.exists(body_path):
+        return {}
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def _atomic_write(path: str, data: bytes):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _write_cache(body_path: str, meta_path: str, url: str, response: requests.Response):
+    os.makedirs(os.path.dirname(body_path), exist_ok=True)
+    # Drop the old metadata first so an interrupted write can only leave a cache miss
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+    _atomic_write(body_path, response.content)
+    _atomic_write(meta_path, json.dumps({
+        "url": url,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }).encode("utf-8"))
+
+
+def fetch_page(session: requests.Session, url: str, cache_dir: str = DEFAULT_CACHE_DIR,
+               timeout: float = DEFAULT_TIMEOUT) -> bytes:
+    """
+    Fetch a page, revalidating any cached copy with ETag/Last-Modified.
+
+    Args:
+        session (requests.Session): Shared session used for the request.
+        url (str): Page to fetch.
+        cache_dir (str): Directory holding cached page bodies and headers.
+        timeout (float): Request timeout in seconds.
+
+    Returns:
+        bytes: Raw page body, either freshly downloaded or from the cache on 304.
+    """
+    body_path, meta_path = _cache_paths(cache_dir, url)
+
+    meta = _read_cache_meta(body_path, meta_path)
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = session.get(url, headers=headers, timeout=timeout)
+
+    if response.status_code == 304 and headers:
+        try:
+            with open(body_path, "rb") as f:
+                return f.read()
+        except OSError:
+            # Cached body vanished after revalidation, fetch it unconditionally
+            response = session.get(url, timeout=timeout)
+
+    if response.status_code == 304:
+        raise requests.HTTPError(
+            f"304 Not Modified without a conditional request for url: {url}", response=response
+        )
+
+    response.raise_for_status()
+
+    _write_cache(body_path, meta_path, url, response)
+    return response.content
+
+
+def _find_column(headers, keywords):
+    for keyword in keywords:
+        for i, header in enumerate(headers):
+            if keyword in header:
+                return i
+    return None
+
+
+def parse_event_page(html) -> list:
+    """
+    Extract events from HTML tables that have a date column and an event column.
+
+    Args:
+        html (bytes or str): Page body. Raw bytes let the parser detect the
+            encoding from the page's own <meta charset>.
+
+    Returns:
+        list: Dicts with 'EventName' and 'EventDate' keys (dates unparsed).
+    """
+    soup = BeautifulSoup(html, "lxml")
+    events = []
+
+    for table in soup.find_all("table"):
+        rows = table.find_all("tr")
+        if not rows:
+            continue
+
+        headers = [cell.get_text(strip=True).lower() for cell in rows[0].find_all(["th", "td"])]
+        date_col = _find_column(headers, DATE_HEADER_KEYWORDS)
+        name_col = _find_column(
+            [h if i != date_col else "" for i, h in enumerate(headers)], EVENT_HEADER_KEYWORDS
+        )
+        if date_col is None or name_col is None:
+            continue
+
+        for row in rows[1:]:
+            cells = row.find_all(["th", "td"])
+            if len(cells) <= max(date_col, name_col):
+                continue
+            date_cell = cells[date_col]
+            time_tag = date_cell.find("time")
+            if time_tag is not None and time_tag.get("datetime"):
+                event_date = time_tag["datetime"]
+            else:
+                event_date = date_cell.get_text(strip=True)
+            events.append({
+                "EventName": cells[name_col].get_text(" ", strip=True),
+                "EventDate": event_date,
+            })
+
+    return events
+
+
+def _collect_one(session, url, cache_dir, timeout, parser):
+    try:
+        html = fetch_page(session, url, cache_dir=cache_dir, timeout=timeout)
+        events = parser(html)
+    except Exception as e:
+        # One bad source should not abort a rebuild over hundreds of pages
+        print(f"⚠️ Failed to collect events from {url}: {e}")
+        return []
+
+    for event in events:
+        event["Source"] = url
+    return events
+
+
+def collect_events(urls, cache_dir: str = DEFAULT_CACHE_DIR, max_workers: int = DEFAULT_MAX_WORKERS,
+                   timeout: float = DEFAULT_TIMEOUT, parser=parse_event_page) -> pd.DataFrame:
+    """
+    Fetch and parse event source pages concurrently into the event schema.
+
+    Args:
+        urls (iterable): Source page URLs.
+        cache_dir (str): Directory for cached page bodies.
+        max_workers (int): Size of the thread pool and connection pool.
+        timeout (float): Per-request timeout in seconds.
+        parser (callable): Function mapping raw page bytes to a list of event dicts.
+
+    Returns:
+        pd.DataFrame: DataFrame with 'EventName', 'EventDate' and 'Source' columns,
+        deduplicated and sorted by 'EventDate'.
+    """
+    urls = list(dict.fromkeys(urls))
+    records = []
+
+    with build_session(max_workers) as session:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda url: _collect_one(session, url, cache_dir, timeout, parser), urls
+            )
+            for events in results:
+                records.extend(events)
+
+    df = pd.DataFrame(records, columns=["EventName", "EventDate", "Source"])
+    # Normalise tz-aware <time> values to naive UTC so mixed offsets don't raise
+    df["EventDate"] = pd.to_datetime(
+        df["EventDate"], errors="coerce", format="mixed", utc=True
+    ).dt.tz_localize(None)
+    df = df.dropna(subset=["EventDate", "EventName"])
+    df = df.drop_duplicates(subset=["EventName", "EventDate"])
+    df = df.sort_values("EventDate").reset_index(drop=True)
+    return df
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 3:
+        print("Usage: python src/data/collect_events.py <urls.txt> <output.csv>")
+        sys.exit(1)
+
+    with open(sys.argv[1], encoding="utf-8") as f:
+        source_urls = [line.strip() for line in f if line.strip()]
+
+    print(f"🔹 Collecting events from {len(source_urls)} sources...")
+    df_events = collect_events(source_urls)
+    df_events.to_csv(sys.argv[2], index=False)
+    print(f"✅ Saved {len(df_events)} events to: {sys.argv[2]}")
@@ -0,0 +1,213 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+from src.data.collect_events import _cache_paths, collect_events, parse_event_page
+
+PAGES = {
+    "/opec": """
+        <table>
+          <tr><th>Date</th><th>Event</th></tr>
+          <tr><td>2020-04-12</td><td>OPEC+ agrees record output cut</td></tr>
+          <tr><td><time datetime="2016-11-30">30 Nov 2016</time></td><td>OPEC Vienna agreement</td></tr>
+        </table>
+    """,
+    "/conflicts": """
+        <table>
+          <tr><th>Event Name</th><th>Event Date</th></tr>
+          <tr><td>Russia invades Ukraine</td><td>2022-02-24</td></tr>
+          <tr><td>Bad row</td><td>not a date</td></tr>
+        </table>
+    """,
+    "/africa": """
+        <html><head><meta charset="utf-8"></head><body>
+        <table>
+          <tr><th>Date</th><th>Event</th></tr>
+          <tr><td>2010-12-01</td><td>C\u00f4te d\u2019Ivoire unrest</td></tr>
+        </table>
+        </body></html>
+    """,
+    "/timezones": """
+        <table>
+          <tr><th>Date</th><th>Event</th></tr>
+          <tr><td><time datetime="2021-03-01T10:00:00+01:00">1 Mar 2021</time></td><td>Tz-aware event</td></tr>
+          <tr><td>2021-02-01</td><td>Plain event</td></tr>
+        </table>
+    """,
+}
+
+LAST_MODIFIED = "Wed, 01 Jan 2020 00:00:00 GMT"
+
+# Served with Last-Modified instead of an ETag
+LAST_MODIFIED_PATHS = {"/africa"}
+
+
+class EventSourceHandler(BaseHTTPRequestHandler):
+    requests_seen = []
+    modified_since_seen = []
+
+    def do_GET(self):
+        etag = f'"{self.path}"'
+        EventSourceHandler.requests_seen.append((self.path, self.headers.get("If-None-Match")))
+        EventSourceHandler.modified_since_seen.append(
+            (self.path, self.headers.get("If-Modified-Since"))
+        )
+
+        if self.path == "/bogus-304":
+            # Misbehaving server answering 304 to an unconditional request
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        if self.path not in PAGES:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        uses_last_modified = self.path in LAST_MODIFIED_PATHS
+        if uses_last_modified and self.headers.get("If-Modified-Since") == LAST_MODIFIED:
+            self.send_response(304)
+            self.end_headers()
+            return
+        if not uses_last_modified and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = PAGES[self.path].encode("utf-8")
+        self.send_response(200)
+        if uses_last_modified:
+            # No charset, so the encoding is only declared in <meta charset>
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Last-Modified", LAST_MODIFIED)
+        else:
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def event_server():
+    # Local stand-in for the event source websites
+    EventSourceHandler.requests_seen = []
+    EventSourceHandler.modified_since_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EventSourceHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_parse_event_page():
+    events = parse_event_page(PAGES["/opec"])
+    assert events == [
+        {"EventName": "OPEC+ agrees record output cut", "EventDate": "2020-04-12"},
+        {"EventName": "OPEC Vienna agreement", "EventDate": "2016-11-30"},
+    ]
+
+
+def test_collect_events_schema(event_server, tmp_path):
+    urls = [f"{event_server}/opec", f"{event_server}/conflicts", f"{event_server}/missing"]
+    df = collect_events(urls, cache_dir=str(tmp_path), max_workers=4)
+
+    # Output matches the schema consumed by clean_event_data
+    assert {"EventName", "EventDate"}.issubset(df.columns)
+    assert pd.api.types.is_datetime64_any_dtype(df["EventDate"])
+    # Invalid dates and unreachable sources are dropped, rows sorted by date
+    assert list(df["EventName"]) == [
+        "OPEC Vienna agreement",
+        "OPEC+ agrees record output cut",
+        "Russia invades Ukraine",
+    ]
+
+
+def test_collect_events_revalidates_cache(event_server, tmp_path):
+    urls = [f"{event_server}/opec"]
+    first = collect_events(urls, cache_dir=str(tmp_path))
+    second = collect_events(urls, cache_dir=str(tmp_path))
+
+    # Second run sends the cached ETag and reuses the cached body on 304
+    assert EventSourceHandler.requests_seen == [("/opec", None), ("/opec", '"/opec"')]
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_collect_events_mixed_timezones(event_server, tmp_path):
+    df = collect_events([f"{event_server}/timezones"], cache_dir=str(tmp_path))
+
+    # tz-aware values are converted to naive UTC instead of raising
+    assert not isinstance(df["EventDate"].dtype, pd.DatetimeTZDtype)
+    assert list(df["EventName"]) == ["Plain event", "Tz-aware event"]
+    assert df.loc[1, "EventDate"] == pd.Timestamp("2021-03-01 09:00:00")
+
+
+def test_collect_events_meta_charset_and_last_modified(event_server, tmp_path):
+    urls = [f"{event_server}/africa"]
+    first = collect_events(urls, cache_dir=str(tmp_path))
+    second = collect_events(urls, cache_dir=str(tmp_path))
+
+    # UTF-8 declared only in <meta charset> is decoded correctly, also from the cache
+    assert list(first["EventName"]) == ["C\u00f4te d\u2019Ivoire unrest"]
+    pd.testing.assert_frame_equal(first, second)
+    # Second run revalidates with If-Modified-Since
+    assert EventSourceHandler.modified_since_seen == [("/africa", None), ("/africa", LAST_MODIFIED)]
+
+
+def test_collect_events_corrupt_cache_meta(event_server, tmp_path):
+    url = f"{event_server}/opec"
+    collect_events([url], cache_dir=str(tmp_path))
+    _, meta_path = _cache_paths(str(tmp_path), url)
+    with open(meta_path, "w", encoding="utf-8") as f:
+        f.write('{"etag": "')
+
+    df = collect_events([url], cache_dir=str(tmp_path))
+
+    # Unreadable metadata is a cache miss: refetched without conditional headers
+    assert len(df) == 2
+    assert EventSourceHandler.requests_seen == [("/opec", None), ("/opec", None)]
+    with open(meta_path, encoding="utf-8") as f:
+        assert json.load(f)["etag"] == '"/opec"'
+
+
+def test_collect_events_missing_cache_body(event_server, tmp_path):
+    url = f"{event_server}/opec"
+    collect_events([url], cache_dir=str(tmp_path))
+    body_path, _ = _cache_paths(str(tmp_path), url)
+    os.remove(body_path)
+
+    df = collect_events([url], cache_dir=str(tmp_path))
+
+    # Metadata without a body must not be revalidated into an empty page
+    assert len(df) == 2
+    assert EventSourceHandler.requests_seen == [("/opec", None), ("/opec", None)]
+
+
+def test_collect_events_unconditional_304_skipped(event_server, tmp_path):
+    urls = [f"{event_server}/bogus-304", f"{event_server}/opec"]
+    df = collect_events(urls, cache_dir=str(tmp_path))
+
+    # The bogus response is neither cached nor allowed to abort the batch
+    assert len(df) == 2
+    body_path, meta_path = _cache_paths(str(tmp_path), urls[0])
+    assert not os.path.exists(body_path) and not os.path.exists(meta_path)
+
+
+def test_collect_events_parser_error_skipped(event_server, tmp_path):
+    def parser(html):
+        if b"OPEC" in html:
+            raise ValueError("unexpected layout")
+        return parse_event_page(html)
+
+    urls = [f"{event_server}/opec", f"{event_server}/conflicts"]
+    df = collect_events(urls, cache_dir=str(tmp_path), parser=parser)
+
+    assert list(df["EventName"]) == ["Russia invades Ukraine"]